@@ -1,10 +1,13 @@
 from __future__ import annotations
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 
 import orjson
 import requests
 from django.conf import settings
+from django.core.cache import cache
+from requests.adapters import HTTPAdapter, Retry
 from rest_framework.response import Response
 
 from sentry import features
@@ -16,9 +19,13 @@ from sentry.api.helpers.autofix import (
     AutofixCodebaseIndexingStatus,
     get_project_codebase_indexing_status,
 )
-from sentry.autofix.utils import get_autofix_repos_from_project_code_mappings
+from sentry.autofix.utils import (
+    get_autofix_integration_cache_key,
+    get_autofix_repos_from_project_code_mappings,
+)
 from sentry.integrations.utils.code_mapping import get_sorted_code_mapping_configs
 from sentry.models.group import Group
+from sentry.models.integrations.repository_project_path_config import RepositoryProjectPathConfig
 from sentry.models.organization import Organization
 from sentry.models.project import Project
 from sentry.services.hybrid_cloud.integration import integration_service
@@ -27,16 +34,70 @@ logger = logging.getLogger(__name__)
 
 from rest_framework.request import Request
 
+# Upper bound on concurrent check-access requests made to Seer for a single project.
+CHECK_ACCESS_MAX_WORKERS = 8
+# (connect, read) timeouts for a single check-access request.
+CHECK_ACCESS_TIMEOUT = (1, 5)
+# The setup check is refetched whenever the issue page regains focus, so briefly cache the
+# GitHub installation lookup.
+SETUP_CHECK_CACHE_TIMEOUT = 30
+
+# Shared across requests (and the check-access worker threads) so connections to Seer are kept
+# alive and reused instead of being re-established for every call.
+seer_autofix_adapter = HTTPAdapter(
+    pool_maxsize=CHECK_ACCESS_MAX_WORKERS * 4,
+    # Only retry Seer's gateway errors, connection errors and timeouts fail right away so a call
+    # stays within `CHECK_ACCESS_TIMEOUT`. Once out of retries the last response is returned, so
+    # `raise_for_status()` still raises an `HTTPError`.
+    max_retries=Retry(
+        total=2,
+        connect=0,
+        read=0,
+        backoff_factor=0.1,
+        status_forcelist=[502, 503, 504],
+        allowed_methods=["POST"],
+        raise_on_status=False,
+    ),
+)
+seer_autofix_session = requests.Session()
+# Every request body is JSON, so send the content type with the session's default headers.
+seer_autofix_session.headers["content-type"] = "application/json;charset=utf-8"
+seer_autofix_session.mount("http://", seer_autofix_adapter)
+seer_autofix_session.mount("https://", seer_autofix_adapter)
+
 
 def get_autofix_integration_setup_problems(
-    organization: Organization, project: Project
+    organization: Organization,
+    project: Project,
+    code_mappings: list[RepositoryProjectPathConfig] | None = None,
 ) -> str | None:
     """
     Runs through the checks to see if we can use the GitHub integration for Autofix.
+    Already loaded `code_mappings` can be passed in to skip looking them up again.
 
     If there are no issues, returns None.
     If there is an issue, returns the reason.
     """
+    if not _has_github_installation(organization):
+        return "integration_missing"
+
+    if code_mappings is None:
+        code_mappings = get_sorted_code_mapping_configs(project)
+
+    if not code_mappings:
+        return "integration_no_code_mappings"
+
+    return None
+
+
+def _has_github_installation(organization: Organization) -> bool:
+    # Only an installed integration is cached, a missing one is looked up again on every check so
+    # the setup check passes as soon as GitHub is installed. The cached value is cleared when the
+    # organization's integrations change, see `sentry.receivers.autofix`.
+    cache_key = get_autofix_integration_cache_key(organization.id)
+    if cache.get(cache_key):
+        return True
+
     organization_integrations = integration_service.get_organization_integrations(
         organization_id=organization.id, providers=["github"], limit=1
     )
@@ -48,41 +109,85 @@ def get_autofix_integration_setup_problems(
     installation = integration and integration.get_installation(organization_id=organization.id)
 
     if not installation:
-        return "integration_missing"
-
-    code_mappings = get_sorted_code_mapping_configs(project)
-
-    if not code_mappings:
-        return "integration_no_code_mappings"
+        return False
 
-    return None
+    cache.set(cache_key, True, SETUP_CHECK_CACHE_TIMEOUT)
+    return True
 
 
-def get_repos_and_access(project: Project) -> list[dict]:
+def get_repos_and_access(
+    project: Project, repos: list[dict] | None = None, bulk: bool = False
+) -> list[dict]:
     """
     Gets the repos that would be indexed for the given project from the code mappings, and checks if we have write access to them.
+    Already resolved `repos` can be passed in to skip looking up the code mappings again.
+    With `bulk`, access to all of the repos is checked with a single request.
 
     Returns a list of repos with the "ok" key set to True if we have write access, False otherwise.
     """
-    repos = get_autofix_repos_from_project_code_mappings(project)
+    if repos is None:
+        repos = get_autofix_repos_from_project_code_mappings(project)
+
+    if not repos:
+        return []
+
+    if bulk:
+        return _check_repos_access_bulk(repos)
+
+    # Most projects map a single repo, don't pay for spinning up worker threads in that case.
+    if len(repos) == 1:
+        return [_check_repo_access(repos[0])]
+
+    # The checks are independent network round-trips, so run them concurrently instead of one
+    # after another.
+    with ThreadPoolExecutor(max_workers=min(len(repos), CHECK_ACCESS_MAX_WORKERS)) as executor:
+        return list(executor.map(_check_repo_access, repos))
 
-    repos_and_access: list[dict] = []
-    for repo in repos:
-        response = requests.post(
-            f"{settings.SEER_AUTOFIX_URL}/v1/automation/codebase/repo/check-access",
+
+def _check_repos_access_bulk(repos: list[dict]) -> list[dict]:
+    # Access is keyed by the repo's external id, repos without one are checked individually.
+    bulk_repos = [repo for repo in repos if repo["external_id"]]
+
+    access = {}
+    if bulk_repos:
+        response = seer_autofix_session.post(
+            f"{settings.SEER_AUTOFIX_URL}/v1/automation/codebase/repos/check-access-bulk",
             data=orjson.dumps(
                 {
-                    "repo": repo,
+                    "repos": bulk_repos,
                 }
             ),
-            headers={"content-type": "application/json;charset=utf-8"},
+            timeout=CHECK_ACCESS_TIMEOUT,
         )
 
         response.raise_for_status()
 
-        repos_and_access.append({**repo, "ok": response.json().get("has_access", False)})
+        access = response.json().get("access", {})
 
-    return repos_and_access
+    return [
+        (
+            {**repo, "ok": access.get(repo["external_id"], False)}
+            if repo["external_id"]
+            else _check_repo_access(repo)
+        )
+        for repo in repos
+    ]
+
+
+def _check_repo_access(repo: dict) -> dict:
+    response = seer_autofix_session.post(
+        f"{settings.SEER_AUTOFIX_URL}/v1/automation/codebase/repo/check-access",
+        data=orjson.dumps(
+            {
+                "repo": repo,
+            }
+        ),
+        timeout=CHECK_ACCESS_TIMEOUT,
+    )
+
+    response.raise_for_status()
+
+    return {**repo, "ok": response.json().get("has_access", False)}
 
 
 @region_silo_endpoint
@@ -101,16 +206,33 @@ class GroupAutofixSetupCheck(GroupEndpoint):
             return Response({"detail": "Feature not enabled for project"}, status=403)
 
         org: Organization = request.organization
-        has_gen_ai_consent = org.get_option("sentry:gen_ai_consent", False)
+        project = group.project
 
-        integration_check = get_autofix_integration_setup_problems(
-            organization=org, project=group.project
+        # Look up the code mapped repos and the feature flag on the request thread, the Seer
+        # requests below only need the resulting payloads and are independent of each other.
+        code_mappings = get_sorted_code_mapping_configs(project)
+        autofix_repos = get_autofix_repos_from_project_code_mappings(
+            project, code_mappings=code_mappings
         )
+        bulk_check_access = features.has("projects:ai-autofix-bulk-check-access", project)
 
-        repos = get_repos_and_access(group.project)
-        write_access_ok = len(repos) > 0 and all(repo["ok"] for repo in repos)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            repos_future = executor.submit(
+                get_repos_and_access, project, repos=autofix_repos, bulk=bulk_check_access
+            )
+            codebase_indexing_future = executor.submit(
+                get_project_codebase_indexing_status, project, repos=autofix_repos
+            )
+
+            has_gen_ai_consent = org.get_option("sentry:gen_ai_consent", False)
+            integration_check = get_autofix_integration_setup_problems(
+                organization=org, project=project, code_mappings=code_mappings
+            )
 
-        codebase_indexing_status = get_project_codebase_indexing_status(group.project)
+            repos = repos_future.result()
+            codebase_indexing_status = codebase_indexing_future.result()
+
+        write_access_ok = len(repos) > 0 and all(repo["ok"] for repo in repos)
 
         return Response(
             {
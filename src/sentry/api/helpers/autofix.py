@@ -13,8 +13,9 @@ class AutofixCodebaseIndexingStatus(str, enum.Enum):
     NOT_INDEXED = "not_indexed"
 
 
-def get_project_codebase_indexing_status(project):
-    repos = get_autofix_repos_from_project_code_mappings(project)
+def get_project_codebase_indexing_status(project, repos=None):
+    if repos is None:
+        repos = get_autofix_repos_from_project_code_mappings(project)
 
     if not repos:
         return None
@@ -25,7 +26,7 @@ def get_project_codebase_indexing_status(project):
             f"{settings.SEER_AUTOFIX_URL}/v1/automation/codebase/index/status",
             data=orjson.dumps(
                 {
-                    "organization_id": project.organization.id,
+                    "organization_id": project.organization_id,
                     "project_id": project.id,
                     "repo": repo,
                 },
@@ -4,6 +4,7 @@ import requests
 from django.conf import settings
 
 from sentry.integrations.utils.code_mapping import get_sorted_code_mapping_configs
+from sentry.models.integrations.repository_project_path_config import RepositoryProjectPathConfig
 from sentry.models.project import Project
 from sentry.models.repository import Repository
 from sentry.utils import json
@@ -23,8 +24,15 @@ class AutofixState(TypedDict):
     request: AutofixRequest
 
 
-def get_autofix_repos_from_project_code_mappings(project: Project) -> list[dict]:
-    code_mappings = get_sorted_code_mapping_configs(project)
+def get_autofix_integration_cache_key(organization_id: int) -> str:
+    return f"autofix:setup:integration:{organization_id}"
+
+
+def get_autofix_repos_from_project_code_mappings(
+    project: Project, code_mappings: list[RepositoryProjectPathConfig] | None = None
+) -> list[dict]:
+    if code_mappings is None:
+        code_mappings = get_sorted_code_mapping_configs(project)
 
     repos: dict[tuple, dict] = {}
     for code_mapping in code_mappings:
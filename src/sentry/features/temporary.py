@@ -499,6 +499,8 @@ def register_temporary_features(manager: FeatureManager):
     ###########################
     # Enable AI Autofix feture on the Issue Details page.
     manager.add("projects:ai-autofix", ProjectFeature, FeatureHandlerStrategy.INTERNAL)
+    # Check Autofix repo write access with a single bulk request to Seer instead of one per repo.
+    manager.add("projects:ai-autofix-bulk-check-access", ProjectFeature, FeatureHandlerStrategy.INTERNAL)
     # Adds additional filters and a new section to issue alert rules.
     manager.add("projects:alert-filters", ProjectFeature, FeatureHandlerStrategy.INTERNAL, default=True)
     manager.add("projects:discard-transaction", ProjectFeature, FeatureHandlerStrategy.INTERNAL)
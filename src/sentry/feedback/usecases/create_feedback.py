@@ -1,17 +1,19 @@
 from __future__ import annotations
 
 import logging
+import time
+from collections.abc import Callable
 from datetime import UTC, datetime
 from enum import Enum
+from functools import cache
 from typing import Any, TypedDict
 from uuid import uuid4
 
-import jsonschema
+import fastjsonschema
 
 from sentry import features
 from sentry.constants import DataCategory
 from sentry.eventstore.models import Event, GroupEvent
-from sentry.feedback.usecases.spam_detection import is_spam
 from sentry.issues.grouptype import FeedbackGroup
 from sentry.issues.issue_occurrence import IssueEvidence, IssueOccurrence
 from sentry.issues.json_schemas import EVENT_PAYLOAD_SCHEMA, LEGACY_EVENT_PAYLOAD_SCHEMA
@@ -29,6 +31,33 @@ logger = logging.getLogger(__name__)
 
 UNREAL_FEEDBACK_UNATTENDED_MESSAGE = "Sent in the unattended mode"
 
+# Formats used by the issue platform schemas. Like jsonschema (which the occurrence consumer
+# validates with) we don't assert them, fastjsonschema would otherwise check or reject them.
+EVENT_PAYLOAD_SCHEMA_FORMATS = {
+    name: lambda value: True for name in ("date-time", "double", "int64", "uint64", "uuid")
+}
+
+# The legacy schema does not allow additional properties, so events with any other top level
+# field (e.g. `logentry`, which every feedback has) can never match it.
+LEGACY_EVENT_PAYLOAD_FIELDS = frozenset(LEGACY_EVENT_PAYLOAD_SCHEMA["properties"])
+
+
+# The schemas are compiled into plain python validation functions on first use rather than at
+# import time, most processes importing this module never create a feedback. Defaults must not be
+# filled in, they would end up in the event sent to the issue platform.
+@cache
+def get_event_payload_validator() -> Callable[[Any], Any]:
+    return fastjsonschema.compile(
+        EVENT_PAYLOAD_SCHEMA, formats=EVENT_PAYLOAD_SCHEMA_FORMATS, use_default=False
+    )
+
+
+@cache
+def get_legacy_event_payload_validator() -> Callable[[Any], Any]:
+    return fastjsonschema.compile(
+        LEGACY_EVENT_PAYLOAD_SCHEMA, formats=EVENT_PAYLOAD_SCHEMA_FORMATS, use_default=False
+    )
+
 
 class FeedbackCreationSource(Enum):
     NEW_FEEDBACK_ENVELOPE = "new_feedback_envelope"
@@ -38,17 +67,19 @@ class FeedbackCreationSource(Enum):
     UPDATE_USER_REPORTS_TASK = "update_user_reports_task"
 
     @classmethod
-    def new_feedback_category_values(cls) -> set[str]:
-        return {
+    @cache
+    def new_feedback_category_values(cls) -> frozenset[str]:
+        return frozenset(
             c.value
             for c in [
                 cls.NEW_FEEDBACK_ENVELOPE,
             ]
-        }
+        )
 
     @classmethod
-    def old_feedback_category_values(cls) -> set[str]:
-        return {
+    @cache
+    def old_feedback_category_values(cls) -> frozenset[str]:
+        return frozenset(
             c.value
             for c in [
                 cls.CRASH_REPORT_EMBED_FORM,
@@ -56,32 +87,32 @@ class FeedbackCreationSource(Enum):
                 cls.USER_REPORT_DJANGO_ENDPOINT,
                 cls.UPDATE_USER_REPORTS_TASK,
             ]
-        }
+        )
+
+
+# Members rather than values, so checking a source doesn't need to look up its value.
+_NEW_FEEDBACK_SOURCES = frozenset(
+    map(FeedbackCreationSource, FeedbackCreationSource.new_feedback_category_values())
+)
+
+
+# Feedback context fields surfaced as evidence, along with whether they are important.
+EVIDENCE_FIELDS = (
+    ("associated_event_id", False),
+    ("contact_email", False),
+    ("message", True),
+    ("name", False),
+)
 
 
 def make_evidence(feedback, source: FeedbackCreationSource, is_message_spam: bool | None):
     evidence_data = {}
     evidence_display = []
-    if feedback.get("associated_event_id"):
-        evidence_data["associated_event_id"] = feedback["associated_event_id"]
-        evidence_display.append(
-            IssueEvidence(
-                name="associated_event_id", value=feedback["associated_event_id"], important=False
-            )
-        )
-    if feedback.get("contact_email"):
-        evidence_data["contact_email"] = feedback["contact_email"]
-        evidence_display.append(
-            IssueEvidence(name="contact_email", value=feedback["contact_email"], important=False)
-        )
-    if feedback.get("message"):
-        evidence_data["message"] = feedback["message"]
-        evidence_display.append(
-            IssueEvidence(name="message", value=feedback["message"], important=True)
-        )
-    if feedback.get("name"):
-        evidence_data["name"] = feedback["name"]
-        evidence_display.append(IssueEvidence(name="name", value=feedback["name"], important=False))
+    for name, important in EVIDENCE_FIELDS:
+        value = feedback.get(name)
+        if value:
+            evidence_data[name] = value
+            evidence_display.append(IssueEvidence(name=name, value=value, important=important))
 
     evidence_data["source"] = source.value
     evidence_display.append(IssueEvidence(name="source", value=source.value, important=False))
@@ -95,29 +126,36 @@ def make_evidence(feedback, source: FeedbackCreationSource, is_message_spam: boo
     return evidence_data, evidence_display
 
 
-def fix_for_issue_platform(event_data):
+def fix_for_issue_platform(
+    event_data,
+    project_id: int | None = None,
+    received: str | None = None,
+    detection_time: datetime | None = None,
+):
     # the issue platform has slightly different requirements than ingest
     # for event schema, so we need to massage the data a bit
     ret_event: dict[str, Any] = {}
 
-    ret_event["timestamp"] = datetime.fromtimestamp(event_data["timestamp"], UTC).isoformat()
+    # callers that already converted the event timestamp can pass it in as `detection_time`
+    if detection_time is None:
+        detection_time = datetime.fromtimestamp(event_data["timestamp"], UTC)
+    ret_event["timestamp"] = detection_time.isoformat()
 
-    ret_event["received"] = event_data["received"]
+    # `project_id` and `received` are only fallbacks, values already on the event take precedence
+    ret_event["received"] = event_data.get("received", received)
 
-    ret_event["project_id"] = event_data["project_id"]
+    ret_event["project_id"] = event_data.get("project_id", project_id)
 
-    ret_event["contexts"] = event_data.get("contexts", {})
+    contexts = event_data.get("contexts", {})
+    feedback_obj = contexts.get("feedback", {})
+    ret_event["contexts"] = contexts
 
     # TODO: remove this once feedback_ingest API deprecated
     # as replay context will be filled in
-    if not event_data["contexts"].get("replay") and event_data["contexts"].get("feedback", {}).get(
-        "replay_id"
-    ):
-        ret_event["contexts"]["replay"] = {
-            "replay_id": event_data["contexts"].get("feedback", {}).get("replay_id")
-        }
+    if not contexts.get("replay") and feedback_obj.get("replay_id"):
+        contexts["replay"] = {"replay_id": feedback_obj["replay_id"]}
     ret_event["event_id"] = event_data["event_id"]
-    ret_event["tags"] = event_data.get("tags", [])
+    ret_event["tags"] = event_data.get("tags", {})
 
     ret_event["platform"] = event_data.get("platform", "other")
     ret_event["level"] = event_data.get("level", "info")
@@ -127,23 +165,21 @@ def fix_for_issue_platform(event_data):
         ret_event["sdk"] = event_data["sdk"]
     ret_event["request"] = event_data.get("request", {})
 
-    ret_event["user"] = event_data.get("user", {})
+    # the user is modified below, so copy it rather than changing the caller's event
+    user = dict(event_data.get("user") or {})
+    ret_event["user"] = user
 
-    if event_data.get("dist") is not None:
-        del event_data["dist"]
-    if event_data.get("user", {}).get("name") is not None:
-        del event_data["user"]["name"]
-    if event_data.get("user", {}).get("isStaff") is not None:
-        del event_data["user"]["isStaff"]
+    user.pop("name", None)
+    user.pop("isStaff", None)
 
-    if event_data.get("user", {}).get("id") is not None:
-        event_data["user"]["id"] = str(event_data["user"]["id"])
+    user_id = user.get("id")
+    if user_id is not None and not isinstance(user_id, str):
+        user["id"] = str(user_id)
 
     # If no user email was provided specify the contact-email as the user-email.
-    feedback_obj = event_data.get("contexts", {}).get("feedback", {})
     contact_email = feedback_obj.get("contact_email")
-    if not ret_event["user"].get("email", ""):
-        ret_event["user"]["email"] = contact_email
+    if not user.get("email", ""):
+        user["email"] = contact_email
 
     # Set the event message to the feedback message.
     ret_event["logentry"] = {"message": feedback_obj.get("message")}
@@ -156,25 +192,24 @@ def should_filter_feedback(event, project_id, source: FeedbackCreationSource):
     # actually get a sent a feedback with this message
     # signifying there is no feedback. Let's go ahead and filter these.
 
-    if (
-        event.get("contexts") is None
-        or event["contexts"].get("feedback") is None
-        or event["contexts"]["feedback"].get("message") is None
-    ):
+    feedback = (event.get("contexts") or {}).get("feedback")
+    message = feedback.get("message") if feedback is not None else None
+
+    if message is None:
         metrics.incr(
             "feedback.create_feedback_issue.filtered",
             tags={"reason": "missing_context"},
         )
         return True
 
-    if event["contexts"]["feedback"]["message"] == UNREAL_FEEDBACK_UNATTENDED_MESSAGE:
+    if message == UNREAL_FEEDBACK_UNATTENDED_MESSAGE:
         metrics.incr(
             "feedback.create_feedback_issue.filtered",
             tags={"reason": "unreal.unattended"},
         )
         return True
 
-    if event["contexts"]["feedback"]["message"].strip() == "":
+    if message.strip() == "":
         metrics.incr("feedback.create_feedback_issue.filtered", tags={"reason": "empty"})
         return True
 
@@ -187,33 +222,38 @@ def create_feedback_issue(event, project_id: int, source: FeedbackCreationSource
     if should_filter_feedback(event, project_id, source):
         return
 
+    feedback = event["contexts"]["feedback"]
     project = Project.objects.get_from_cache(id=project_id)
 
     is_message_spam = None
-    if features.has(
+    # Project options are served from a local cache, so check the option before the feature flag.
+    if project.get_option("sentry:feedback_ai_spam_detection") and features.has(
         "organizations:user-feedback-spam-filter-ingest", project.organization
-    ) and project.get_option("sentry:feedback_ai_spam_detection"):
+    ):
+        # Imported here so processes that never check for spam don't load the LLM providers
+        # (and their client libraries).
+        from sentry.feedback.usecases.spam_detection import is_spam
+
         try:
-            is_message_spam = is_spam(event["contexts"]["feedback"]["message"])
+            is_message_spam = is_spam(feedback["message"])
         except Exception:
             # until we have LLM error types ironed out, just catch all exceptions
             logger.exception("Error checking if message is spam")
 
     # Note that some of the fields below like title and subtitle
     # are not used by the feedback UI, but are required.
-    event["event_id"] = event.get("event_id") or uuid4().hex
+    event_id = event.get("event_id") or uuid4().hex
+    event["event_id"] = event_id
     detection_time = datetime.fromtimestamp(event["timestamp"], UTC)
-    evidence_data, evidence_display = make_evidence(
-        event["contexts"]["feedback"], source, is_message_spam
-    )
-    issue_fingerprint = [uuid4().hex]
+    evidence_data, evidence_display = make_evidence(feedback, source, is_message_spam)
+    issue_fingerprint = (uuid4().hex,)
     occurrence = IssueOccurrence(
         id=uuid4().hex,
-        event_id=event.get("event_id") or uuid4().hex,
+        event_id=event_id,
         project_id=project_id,
         fingerprint=issue_fingerprint,  # random UUID for fingerprint so feedbacks are grouped individually
         issue_title="User Feedback",
-        subtitle=event["contexts"]["feedback"]["message"],
+        subtitle=feedback["message"],
         resource_id=None,
         evidence_data=evidence_data,
         evidence_display=evidence_display,
@@ -222,15 +262,11 @@ def create_feedback_issue(event, project_id: int, source: FeedbackCreationSource
         culprit="user",  # TODO: fill in culprit correctly -- URL or paramaterized route/tx name?
         level=event.get("level", "info"),
     )
-    now = datetime.now()
+    now = datetime.now(UTC)
 
-    event_data = {
-        "project_id": project_id,
-        "received": now.isoformat(),
-        "tags": event.get("tags", {}),
-        **event,
-    }
-    event_fixed = fix_for_issue_platform(event_data)
+    event_fixed = fix_for_issue_platform(
+        event, project_id=project_id, received=now.isoformat(), detection_time=detection_time
+    )
 
     # make sure event data is valid for issue platform
     validate_issue_platform_event_schema(event_fixed)
@@ -238,25 +274,21 @@ def create_feedback_issue(event, project_id: int, source: FeedbackCreationSource
     if not project.flags.has_feedbacks:
         first_feedback_received.send_robust(project=project, sender=Project)
 
-    if (
-        source
-        in [
-            FeedbackCreationSource.NEW_FEEDBACK_ENVELOPE,
-        ]
-        and not project.flags.has_new_feedbacks
-    ):
+    if source in _NEW_FEEDBACK_SOURCES and not project.flags.has_new_feedbacks:
         first_new_feedback_received.send_robust(project=project, sender=Project)
 
     produce_occurrence_to_kafka(
         payload_type=PayloadType.OCCURRENCE, occurrence=occurrence, event_data=event_fixed
     )
+    # Producing only enqueues the message, so the status change below goes out right behind the
+    # occurrence. Both are keyed by the fingerprint, which keeps them in order on one partition.
     if is_message_spam:
         auto_ignore_spam_feedbacks(project, issue_fingerprint)
     metrics.incr(
         "feedback.create_feedback_issue.produced_occurrence",
         tags={
             "referrer": source.value,
-            "client_source": event["contexts"]["feedback"].get("source"),
+            "client_source": feedback.get("source"),
         },
         sample_rate=1.0,
     )
@@ -267,7 +299,7 @@ def create_feedback_issue(event, project_id: int, source: FeedbackCreationSource
         outcome=Outcome.ACCEPTED,
         reason=None,
         timestamp=detection_time,
-        event_id=event["event_id"],
+        event_id=event_id,
         category=DataCategory.USER_REPORT_V2,
         quantity=1,
     )
@@ -277,13 +309,19 @@ def validate_issue_platform_event_schema(event_data):
     """
     The issue platform schema validation does not run in dev atm so we have to do the validation
     ourselves, or else our tests are not representative of what happens in prod.
+
+    The occurrence consumer validates the event after it went through JSON, so tuples are
+    accepted wherever the schema expects an array.
     """
     try:
-        jsonschema.validate(event_data, EVENT_PAYLOAD_SCHEMA)
-    except jsonschema.exceptions.ValidationError:
+        get_event_payload_validator()(event_data)
+    except fastjsonschema.JsonSchemaException:
         try:
-            jsonschema.validate(event_data, LEGACY_EVENT_PAYLOAD_SCHEMA)
-        except jsonschema.exceptions.ValidationError:
+            # Skip walking the event again if it can't possibly match the legacy schema.
+            if not LEGACY_EVENT_PAYLOAD_FIELDS.issuperset(event_data):
+                raise
+            get_legacy_event_payload_validator()(event_data)
+        except fastjsonschema.JsonSchemaException:
             metrics.incr("feedback.create_feedback_issue.invalid_schema")
             raise
 
@@ -331,14 +369,14 @@ def shim_to_feedback(
             feedback_event["timestamp"] = event.datetime.timestamp()
             feedback_event["level"] = event.data["level"]
             feedback_event["platform"] = event.platform
-            feedback_event["level"] = event.data["level"]
             feedback_event["environment"] = event.get_environment().name
-            feedback_event["tags"] = [list(item) for item in event.tags]
+            # Event tags are (key, value) tuples, the issue platform schema expects them as lists.
+            feedback_event["tags"] = list(map(list, event.tags))
 
         else:
             metrics.incr("feedback.user_report.missing_event", sample_rate=1.0)
 
-            feedback_event["timestamp"] = datetime.utcnow().timestamp()
+            feedback_event["timestamp"] = time.time()
             feedback_event["platform"] = "other"
             feedback_event["level"] = report.get("level", "info")
 
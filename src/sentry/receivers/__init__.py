@@ -1,5 +1,6 @@
 from .analytics import *  # noqa: F401,F403
 from .auth import *  # noqa: F401,F403
+from .autofix import *  # noqa: F401,F403
 from .core import *  # noqa: F401,F403
 from .email import *  # noqa: F401,F403
 from .experiments import *  # noqa: F401,F403
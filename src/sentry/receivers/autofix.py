@@ -0,0 +1,25 @@
+from django.db.models.signals import post_delete, post_save
+
+from sentry.autofix.utils import get_autofix_integration_cache_key
+from sentry.models.integrations.organization_integration import OrganizationIntegration
+from sentry.utils.cache import cache
+
+
+def clear_autofix_integration_cache(instance: OrganizationIntegration, **kwargs):
+    # Organization integrations live in the control silo, in a split deployment the autofix
+    # setup check in the regions falls back to its cache timeout after an uninstall.
+    cache.delete(get_autofix_integration_cache_key(instance.organization_id))
+
+
+post_save.connect(
+    clear_autofix_integration_cache,
+    sender=OrganizationIntegration,
+    dispatch_uid="clear_autofix_integration_cache_on_save",
+    weak=False,
+)
+post_delete.connect(
+    clear_autofix_integration_cache,
+    sender=OrganizationIntegration,
+    dispatch_uid="clear_autofix_integration_cache_on_delete",
+    weak=False,
+)
@@ -1,10 +1,15 @@
+from unittest import mock
 from unittest.mock import patch
 
+import orjson
+from django.conf import settings
+
+from sentry.api.endpoints.group_autofix_setup_check import get_repos_and_access
 from sentry.api.helpers.autofix import AutofixCodebaseIndexingStatus
 from sentry.models.integrations.repository_project_path_config import RepositoryProjectPathConfig
 from sentry.models.repository import Repository
 from sentry.silo.base import SiloMode
-from sentry.testutils.cases import APITestCase, SnubaTestCase
+from sentry.testutils.cases import APITestCase, SnubaTestCase, TestCase
 from sentry.testutils.helpers.features import apply_feature_flag_on_cls
 from sentry.testutils.silo import assume_test_silo_mode
 
@@ -84,6 +89,21 @@ class GroupAIAutofixEndpointSuccessTest(APITestCase, SnubaTestCase):
             },
         }
 
+    @patch(
+        "sentry.api.endpoints.group_autofix_setup_check.get_repos_and_access",
+        return_value=[],
+    )
+    def test_bulk_check_access_flag(self, mock_get_repos_and_access):
+        group = self.create_group()
+        self.login_as(user=self.user)
+        url = f"/api/0/issues/{group.id}/autofix/setup/"
+
+        with self.feature("projects:ai-autofix-bulk-check-access"):
+            response = self.client.get(url, format="json")
+
+        assert response.status_code == 200
+        assert mock_get_repos_and_access.call_args.kwargs["bulk"] is True
+
 
 @apply_feature_flag_on_cls("projects:ai-autofix")
 class GroupAIAutofixEndpointFailureTest(APITestCase, SnubaTestCase):
@@ -132,6 +152,62 @@ class GroupAIAutofixEndpointFailureTest(APITestCase, SnubaTestCase):
             "reason": "integration_missing",
         }
 
+    def test_missing_integration_is_not_cached(self):
+        integration = self.organization_integration.integration
+        with assume_test_silo_mode(SiloMode.CONTROL):
+            self.organization_integration.delete()
+
+        group = self.create_group()
+        self.login_as(user=self.user)
+        url = f"/api/0/issues/{group.id}/autofix/setup/"
+        response = self.client.get(url, format="json")
+
+        assert response.status_code == 200
+        assert response.data["integration"] == {
+            "ok": False,
+            "reason": "integration_missing",
+        }
+
+        with assume_test_silo_mode(SiloMode.CONTROL):
+            integration.add_organization(self.organization, self.user)
+
+        response = self.client.get(url, format="json")
+
+        assert response.status_code == 200
+        assert response.data["integration"] == {"ok": True, "reason": None}
+
+    def test_integration_check_cache_is_cleared(self):
+        group = self.create_group()
+        self.login_as(user=self.user)
+        url = f"/api/0/issues/{group.id}/autofix/setup/"
+        response = self.client.get(url, format="json")
+
+        assert response.status_code == 200
+        assert response.data["integration"] == {"ok": True, "reason": None}
+
+        RepositoryProjectPathConfig.objects.filter(
+            organization_integration_id=self.organization_integration.id
+        ).delete()
+
+        response = self.client.get(url, format="json")
+
+        assert response.status_code == 200
+        assert response.data["integration"] == {
+            "ok": False,
+            "reason": "integration_no_code_mappings",
+        }
+
+        with assume_test_silo_mode(SiloMode.CONTROL):
+            self.organization_integration.delete()
+
+        response = self.client.get(url, format="json")
+
+        assert response.status_code == 200
+        assert response.data["integration"] == {
+            "ok": False,
+            "reason": "integration_missing",
+        }
+
     @patch(
         "sentry.api.endpoints.group_autofix_setup_check.get_repos_and_access",
         return_value=[
@@ -208,3 +284,127 @@ class GroupAIAutofixEndpointFailureTest(APITestCase, SnubaTestCase):
         assert response.data["codebaseIndexing"] == {
             "ok": False,
         }
+
+
+class GetReposAndAccessTest(TestCase):
+    @patch("sentry.api.endpoints.group_autofix_setup_check.seer_autofix_session.post")
+    def test_checks_each_repo(self, mock_post):
+        repo1 = self.create_repo(
+            name="getsentry/sentry", provider="integrations:github", external_id="123"
+        )
+        repo2 = self.create_repo(
+            name="getsentry/relay", provider="integrations:github", external_id="234"
+        )
+        self.create_code_mapping(project=self.project, repo=repo1, stack_root="/path1")
+        self.create_code_mapping(project=self.project, repo=repo2, stack_root="/path2")
+
+        def check_access(url, data, **kwargs):
+            has_access = orjson.loads(data)["repo"]["name"] == "sentry"
+            return mock.Mock(
+                status_code=200, json=mock.Mock(return_value={"has_access": has_access})
+            )
+
+        mock_post.side_effect = check_access
+
+        repos = get_repos_and_access(self.project)
+
+        assert mock_post.call_count == 2
+        assert mock_post.call_args.args[0] == (
+            f"{settings.SEER_AUTOFIX_URL}/v1/automation/codebase/repo/check-access"
+        )
+        assert sorted(repos, key=lambda repo: repo["external_id"]) == [
+            {
+                "provider": "integrations:github",
+                "owner": "getsentry",
+                "name": "sentry",
+                "external_id": "123",
+                "ok": True,
+            },
+            {
+                "provider": "integrations:github",
+                "owner": "getsentry",
+                "name": "relay",
+                "external_id": "234",
+                "ok": False,
+            },
+        ]
+
+    @patch("sentry.api.endpoints.group_autofix_setup_check.ThreadPoolExecutor")
+    @patch("sentry.api.endpoints.group_autofix_setup_check.seer_autofix_session.post")
+    def test_single_repo_is_checked_inline(self, mock_post, mock_executor):
+        repo = self.create_repo(
+            name="getsentry/sentry", provider="integrations:github", external_id="123"
+        )
+        self.create_code_mapping(project=self.project, repo=repo)
+
+        mock_post.return_value = mock.Mock(
+            status_code=200, json=mock.Mock(return_value={"has_access": True})
+        )
+
+        repos = get_repos_and_access(self.project)
+
+        assert mock_executor.call_count == 0
+        assert mock_post.call_count == 1
+        assert repos == [
+            {
+                "provider": "integrations:github",
+                "owner": "getsentry",
+                "name": "sentry",
+                "external_id": "123",
+                "ok": True,
+            }
+        ]
+
+    @patch("sentry.api.endpoints.group_autofix_setup_check.seer_autofix_session.post")
+    def test_no_repos(self, mock_post):
+        assert get_repos_and_access(self.project) == []
+        assert mock_post.call_count == 0
+
+    @patch("sentry.api.endpoints.group_autofix_setup_check.seer_autofix_session.post")
+    def test_bulk_check_access(self, mock_post):
+        repo1 = self.create_repo(
+            name="getsentry/sentry", provider="integrations:github", external_id="123"
+        )
+        repo2 = self.create_repo(
+            name="getsentry/relay", provider="integrations:github", external_id="234"
+        )
+        self.create_code_mapping(project=self.project, repo=repo1, stack_root="/path1")
+        self.create_code_mapping(project=self.project, repo=repo2, stack_root="/path2")
+
+        mock_post.return_value = mock.Mock(
+            status_code=200,
+            json=mock.Mock(return_value={"access": {"123": True, "234": False}}),
+        )
+
+        repos = get_repos_and_access(self.project, bulk=True)
+
+        assert mock_post.call_count == 1
+        assert mock_post.call_args.args[0] == (
+            f"{settings.SEER_AUTOFIX_URL}/v1/automation/codebase/repos/check-access-bulk"
+        )
+        assert {repo["external_id"]: repo["ok"] for repo in repos} == {"123": True, "234": False}
+
+    @patch("sentry.api.endpoints.group_autofix_setup_check.seer_autofix_session.post")
+    def test_bulk_check_access_without_external_id(self, mock_post):
+        repo1 = self.create_repo(
+            name="getsentry/sentry", provider="integrations:github", external_id="123"
+        )
+        repo2 = self.create_repo(name="getsentry/relay", provider="integrations:github")
+        self.create_code_mapping(project=self.project, repo=repo1, stack_root="/path1")
+        self.create_code_mapping(project=self.project, repo=repo2, stack_root="/path2")
+
+        def check_access(url, data, **kwargs):
+            if url.endswith("/check-access-bulk"):
+                payload = {"access": {"123": False}}
+            else:
+                payload = {"has_access": True}
+            return mock.Mock(status_code=200, json=mock.Mock(return_value=payload))
+
+        mock_post.side_effect = check_access
+
+        repos = get_repos_and_access(self.project, bulk=True)
+
+        assert mock_post.call_count == 2
+        bulk_payload = orjson.loads(mock_post.call_args_list[0].kwargs["data"])
+        assert [repo["name"] for repo in bulk_payload["repos"]] == ["sentry"]
+        assert {repo["name"]: repo["ok"] for repo in repos} == {"sentry": False, "relay": True}
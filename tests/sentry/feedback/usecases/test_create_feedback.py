@@ -1,10 +1,14 @@
 from __future__ import annotations
 
 import time
+from copy import deepcopy
 from typing import Any
 from unittest.mock import Mock
 
+import fastjsonschema
+import jsonschema
 import pytest
+from django.test import override_settings
 from openai.types.chat.chat_completion import ChatCompletion, Choice
 from openai.types.chat.chat_completion_message import ChatCompletionMessage
 
@@ -12,12 +16,16 @@ from sentry.feedback.usecases.create_feedback import (
     FeedbackCreationSource,
     create_feedback_issue,
     fix_for_issue_platform,
+    get_event_payload_validator,
+    get_legacy_event_payload_validator,
     validate_issue_platform_event_schema,
 )
+from sentry.issues.json_schemas import EVENT_PAYLOAD_SCHEMA, LEGACY_EVENT_PAYLOAD_SCHEMA
 from sentry.models.group import Group, GroupStatus
 from sentry.testutils.helpers import Feature
 from sentry.testutils.pytest.fixtures import django_db_all
 from sentry.types.group import GroupSubStatus
+from sentry.utils import json
 
 
 @pytest.fixture
@@ -133,6 +141,12 @@ def test_fix_for_issue_platform():
         "url": "https://sentry.sentry.io/feedback/?statsPeriod=14d",
     }
     assert fixed_event["logentry"]["message"] == event["contexts"]["feedback"]["message"]
+    assert fixed_event["user"]["id"] == "880461"
+    assert "name" not in fixed_event["user"]
+    assert "isStaff" not in fixed_event["user"]
+    # The user on the original event is left untouched.
+    assert event["user"]["id"] == 880461
+    assert event["user"]["name"] == "Josh Ferge"
 
     # Assert the contact-email is set as the user-email when no user-email exists.
     event["user"].pop("email")
@@ -234,6 +248,100 @@ def test_corrected_still_works():
     assert isinstance(fixed_event["received"], str)
 
 
+def test_validate_skips_legacy_schema_for_unmatchable_event(monkeypatch):
+    mock_validate_legacy = Mock()
+    monkeypatch.setattr(
+        "sentry.feedback.usecases.create_feedback.get_legacy_event_payload_validator",
+        Mock(return_value=mock_validate_legacy),
+    )
+
+    event: dict[str, Any] = {
+        "project_id": 1,
+        "event_id": "56b08cf7852c42cbb95e4a6998c66ad6",
+        "timestamp": 1698255009.574,
+        "platform": "javascript",
+        "level": "info",
+        # Only the legacy schema allows non-string tag values.
+        "tags": {"key": {"nested": 1}},
+        "logentry": {"message": "hello"},
+    }
+
+    with pytest.raises(fastjsonschema.JsonSchemaException):
+        validate_issue_platform_event_schema(event)
+    assert mock_validate_legacy.call_count == 0
+
+    # Without any fields unknown to the legacy schema it is still used as a fallback.
+    del event["logentry"]
+    validate_issue_platform_event_schema(event)
+    assert mock_validate_legacy.call_count == 1
+
+
+_VALID_FIXED_EVENT: dict[str, Any] = {
+    "timestamp": "2023-10-25T17:30:09.574000+00:00",
+    "received": "2021-10-24T22:23:29.574000+00:00",
+    "project_id": 1,
+    "contexts": {
+        "feedback": {"message": "hello", "contact_email": "josh.ferge@sentry.io"},
+        "replay": {"replay_id": "3d621c61593c4ff9b43f8490a78ae18e"},
+    },
+    "event_id": "56b08cf7852c42cbb95e4a6998c66ad6",
+    "tags": {"transaction": "/feedback/"},
+    "platform": "javascript",
+    "level": "info",
+    "environment": "prod",
+    "request": {},
+    "user": {"id": "880461", "email": "josh.ferge@sentry.io"},
+    "logentry": {"message": "hello"},
+}
+_VALID_FIXED_EVENT_WITHOUT_LOGENTRY = {
+    k: v for k, v in _VALID_FIXED_EVENT.items() if k != "logentry"
+}
+
+
+@pytest.mark.parametrize(
+    "event",
+    [
+        _VALID_FIXED_EVENT,
+        _VALID_FIXED_EVENT_WITHOUT_LOGENTRY,
+        {**_VALID_FIXED_EVENT, "tags": [["transaction", "/feedback/"]]},
+        {**_VALID_FIXED_EVENT, "tags": {"key": {"nested": 1}}},
+        {**_VALID_FIXED_EVENT_WITHOUT_LOGENTRY, "tags": {"key": {"nested": 1}}},
+        {**_VALID_FIXED_EVENT, "received": "not a date"},
+        {**_VALID_FIXED_EVENT, "received": 1698255009.574},
+        {**_VALID_FIXED_EVENT, "project_id": "1"},
+        {**_VALID_FIXED_EVENT, "level": ""},
+        {**_VALID_FIXED_EVENT, "user": {"id": 880461}},
+        {**_VALID_FIXED_EVENT, "sdk": {"name": "sentry.javascript.react"}},
+        {**_VALID_FIXED_EVENT, "sdk": {"name": "sentry.javascript.react", "version": "7.75.0"}},
+        {**_VALID_FIXED_EVENT, "tags": [("transaction", "/feedback/")]},
+        {**_VALID_FIXED_EVENT, "tags": (("transaction", "/feedback/"),)},
+        {**_VALID_FIXED_EVENT, "tags": [("transaction",)]},
+        {**_VALID_FIXED_EVENT, "tags": [("transaction", {"nested": 1})]},
+        {**_VALID_FIXED_EVENT_WITHOUT_LOGENTRY, "tags": [("transaction", "/feedback/")]},
+    ],
+)
+def test_compiled_schemas_agree_with_jsonschema(event):
+    # The occurrence consumer validates the event after it was sent as JSON, which e.g. turns
+    # tuples into lists, so that's what the compiled validators have to agree with.
+    sent_event = json.loads(json.dumps(event))
+    for schema, compiled in (
+        (EVENT_PAYLOAD_SCHEMA, get_event_payload_validator()),
+        (LEGACY_EVENT_PAYLOAD_SCHEMA, get_legacy_event_payload_validator()),
+    ):
+        validator = jsonschema.validators.validator_for(schema)(schema)
+        original_event = deepcopy(event)
+        try:
+            compiled(event)
+        except fastjsonschema.JsonSchemaException:
+            compiled_is_valid = False
+        else:
+            compiled_is_valid = True
+
+        assert compiled_is_valid == validator.is_valid(sent_event)
+        # the compiled validators must not fill in defaults
+        assert event == original_event
+
+
 @django_db_all
 def test_create_feedback_filters_unreal(default_project, mock_produce_occurrence_to_kafka):
     event = {
@@ -554,6 +662,42 @@ def test_create_feedback_spam_detection_adds_field(
                 assert mock_produce_occurrence_to_kafka.call_count == 1
 
 
+@django_db_all
+@override_settings(SENTRY_EVENTSTREAM="sentry.eventstream.kafka.KafkaEventStream")
+def test_create_feedback_spam_status_change_shares_partition_key(default_project, monkeypatch):
+    mock_produce = Mock()
+    monkeypatch.setattr("sentry.issues.producer._occurrence_producer.produce", mock_produce)
+    monkeypatch.setattr("sentry.feedback.usecases.spam_detection.is_spam", Mock(return_value=True))
+
+    event = {
+        "project_id": default_project.id,
+        "event_id": "56b08cf7852c42cbb95e4a6998c66ad6",
+        "timestamp": 1698255009.574,
+        "received": "2021-10-24T22:23:29.574000+00:00",
+        "contexts": {"feedback": {"message": "This is definitely spam"}},
+        "platform": "javascript",
+    }
+
+    with Feature(
+        {
+            "organizations:user-feedback-spam-filter-ingest": True,
+            "organizations:user-feedback-spam-filter-actions": True,
+        }
+    ):
+        create_feedback_issue(
+            event, default_project.id, FeedbackCreationSource.NEW_FEEDBACK_ENVELOPE
+        )
+
+    # The status change is only ordered after the occurrence if both land on the same partition.
+    assert mock_produce.call_count == 2
+    occurrence_payload = mock_produce.call_args_list[0].args[1]
+    status_change_payload = mock_produce.call_args_list[1].args[1]
+    assert json.loads(occurrence_payload.value.decode())["payload_type"] == "occurrence"
+    assert json.loads(status_change_payload.value.decode())["payload_type"] == "status_change"
+    assert occurrence_payload.key is not None
+    assert occurrence_payload.key == status_change_payload.key
+
+
 @django_db_all
 def test_create_feedback_spam_detection_option_false(
     default_project,